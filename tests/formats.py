@@ -774,6 +774,34 @@ class TestGFMAutolinks(tests.TestCase):
 				self.assertFalse(is_url(input))
 
 
+class TestZimMarkdownAutolinks(tests.TestCase):
+
+	def parse(self, text):
+		from zim.formats.zim_markdown import Parser
+		parser = Parser()
+		parser.page = None
+		parser.layout = None
+		return parser.parse([text]).tostring()
+
+	def testEmailAtStartOfWord(self):
+		text = 'mail foo@bar.com or mailto:foo@bar.com or xmailto:foo@bar.com\n'
+		xml = '''\
+<?xml version='1.0' encoding='utf-8'?>
+<zim-tree><p>mail <link href="foo@bar.com">foo@bar.com</link> or <link href="mailto:foo@bar.com">mailto:foo@bar.com</link> or xmailto:<link href="foo@bar.com">foo@bar.com</link>
+</p></zim-tree>'''
+		self.assertEqual(self.parse(text), xml)
+
+	def testLongWordDoesNotBacktrack(self):
+		# An email match starting at every position of a long word
+		# made parsing quadratic in the word length
+		import time
+		text = 'a' * 50000 + '\n'
+		start = time.time()
+		xml = self.parse(text)
+		self.assertLess(time.time() - start, 1.0)
+		self.assertNotIn('<link', xml)
+
+
 class TestHtmlFormat(tests.TestCase, TestFormatMixin):
 
 	def setUp(self):
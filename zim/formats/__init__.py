@@ -1174,9 +1174,10 @@ class DumperClass(Visitor):
 			raise AssertionError('Unexpected tag closed: %s' % tag)
 		_, attrib, strings = self.context.pop()
 
-		if tag in self.TAGS:
+		fix = self.TAGS.get(tag)
+		if fix is not None:
 			assert strings, 'Can not append empty %s element' % tag
-			start, end = self.TAGS[tag]
+			start, end = fix
 			strings.insert(0, start)
 			strings.append(end)
 		elif tag == FORMATTEDTEXT:
@@ -1198,9 +1199,10 @@ class DumperClass(Visitor):
 
 	def append(self, tag, attrib=None, text=None):
 		strings = None
-		if tag in self.TAGS:
+		fix = self.TAGS.get(tag)
+		if fix is not None:
 			assert text is not None, 'Can not append empty %s element' % tag
-			start, end = self.TAGS[tag]
+			start, end = fix
 			text = self.encode_text(tag, text)
 			strings = [start, text, end]
 		elif tag == FORMATTEDTEXT:
@@ -141,34 +141,35 @@ class Dumper(DumperClass):
 
 		# TODO accept multi-line content here - e.g. nested paras
 
-		if self.context[-1].tag == BULLETLIST:
-			if 'bullet' in attrib \
-			and attrib['bullet'] in self.BULLETS:
-				bullet = self.BULLETS[attrib['bullet']]
-			else:
-				bullet = self.BULLETS[BULLET]
-		elif self.context[-1].tag == NUMBEREDLIST:
-			iter = self.context[-1].attrib.get('_iter')
+		bullets = self.BULLETS
+		parent = self.context[-1]
+		if parent.tag == BULLETLIST:
+			bullet = bullets.get(attrib.get('bullet')) or bullets[BULLET]
+		elif parent.tag == NUMBEREDLIST:
+			iter = parent.attrib.get('_iter')
 			if not iter:
 				# First item on this level
-				iter = self.context[-1].attrib.get('start', 1)
+				iter = parent.attrib.get('start', 1)
 			bullet = iter + '.'
-			self.context[-1].attrib['_iter'] = increase_list_iter(iter) or '1'
+			parent.attrib['_iter'] = increase_list_iter(iter) or '1'
 		else:
 			# HACK for raw tree from pageview
 			# support indenting
 			# support any bullet type (inc numbered)
 
 			bullet = attrib.get('bullet', BULLET)
-			if bullet in self.BULLETS:
-				bullet = self.BULLETS[attrib['bullet']]
+			if bullet in bullets:
+				bullet = bullets[attrib['bullet']]
 			# else assume it is numbered..
 
 			if 'indent' in attrib:
 				prefix = int(attrib['indent']) * '\t'
 				bullet = prefix + bullet
 
-		return (bullet, ' ') + tuple(strings) + ('\n',)
+		result = [bullet, ' ']
+		result.extend(strings)
+		result.append('\n')
+		return result
 
 	def dump_link(self, tag, attrib, strings=None):
 		# Just plain text, either text of link, or link href
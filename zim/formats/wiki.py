@@ -6,6 +6,8 @@
 import re
 import logging
 
+from collections import deque
+
 logger = logging.getLogger('zim.formats.wiki')
 
 from zim.parser import Rule, fix_line_end, convert_space_to_tab
@@ -485,7 +487,7 @@ class WikiParser(object):
 		else:
 			attrib = None
 
-		lines = text.splitlines(True)
+		lines = deque(text.splitlines(True))
 		self.parse_list_lines(builder, lines, 0, attrib)
 
 	def parse_list_lines(self, builder, lines, level, attrib=None):
@@ -535,7 +537,7 @@ class WikiParser(object):
 				self.inline_parser(builder, text)
 				builder.end(LISTITEM)
 
-				lines.pop(0)
+				lines.popleft()
 
 		builder.end(listtype)
 
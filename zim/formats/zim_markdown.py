@@ -74,10 +74,26 @@ unindented_line_re = re.compile('^\S', re.M)
 	# match any unindented line
 
 
+_indent_re_cache = {}
+	# compiled patterns for _remove_indent() per indent string
+
 def _remove_indent(text, indent):
-	return re.sub('(?m)^' + indent, '', text)
-		# Specify "(?m)" instead of re.M since "flags" keyword is not
-		# supported in python 2.6
+	try:
+		indent_re = _indent_re_cache[indent]
+	except KeyError:
+		indent_re = re.compile('^' + re.escape(indent), re.M)
+		_indent_re_cache[indent] = indent_re
+	return indent_re.sub('', text)
+
+
+def _split_table_row(line):
+	# Only need to respect escapes if the row contains a backslash,
+	# otherwise a plain split gives the same result
+	line = line.strip().strip('|')
+	if '\\' in line:
+		return split_escaped_string(line, '|')
+	else:
+		return line.split('|')
 
 
 # NOTE: we follow rules of GFM spec, except:
@@ -97,6 +113,7 @@ url_re = re.compile(
 
 	')|(?P<email>'
 
+	'(?<![\w\.\-_+])'			# start of word, avoids rescanning long words
 	'(mailto:)?'
 	'[\w\.\-_+]+@'				# email prefix
 	'([\w\-_]+\.)+[\w\-_]+'	# email domain
@@ -110,6 +127,59 @@ url_re = re.compile(
 )
 
 url_trailing_punctuation = ('?', '!', '.', ',', ':', '*', '_', '~')
+_url_trailing_punctuation = frozenset(url_trailing_punctuation)
+_url_tail_chars = _url_trailing_punctuation | frozenset((')', ';'))
+
+url_entity_ref_re = re.compile(r'&\w+;$')
+	# matches entity reference at the end of an url, e.g. "&amp;"
+
+
+# Block level patterns, formatted once at import so creating a parser
+# instance does not need to rebuild them. They are plain strings because
+# L{Parser} combines the rules into one regex, compiled with the flags
+# C{re.U}, C{re.M} and C{re.X}.
+bullet_list_pattern = r'''(
+	^ %s .* \n								# Line starting with bullet
+	(?:
+		^ \t* %s .* \n						# Line with same or more indent and bullet
+	)*										# .. repeat
+)''' % (bullet_pattern, bullet_pattern)
+
+indented_bullet_list_pattern = r'''(
+	^(?P<list_indent>\t+) %s .* \n			# Line with indent and bullet
+	(?:
+		^(?P=list_indent) \t* %s .* \n		# Line with same or more indent and bullet
+	)*										# .. repeat
+)''' % (bullet_pattern, bullet_pattern)
+
+indented_block_pattern = r'''(
+	^(?P<block_indent>\t+) .* \n			# Line with indent
+	(?:
+		^(?P=block_indent) (?!\t|%s) .* \n	# Line with _same_ indent, no bullet
+	)*										# .. repeat
+)''' % bullet_pattern
+
+verbatim_block_pattern = r'''
+	^(?P<pre_indent>\t*) \`\`\` \s*?				# 3 "`"
+	( (?:^.*\n)*? )									# multi-line text
+	^(?P=pre_indent) \`\`\` \s*? \n					# another 3 "`" with matching indent
+'''
+
+object_pattern = r'''
+	^(?P<obj_indent>\t*) \{\{\{ \s*? (\S+:.*\n)		# "{{{ object_type: attrib=..."
+	( (?:^.*\n)*? ) 								# multi-line body
+	^(?P=obj_indent) \}\}\} \s*? \n					# "}}}" with matching indent
+'''
+
+heading_pattern = r'^( \#+ [\ \t]+ \S.*? ) [\ \t]* \n'		# "### heading"
+
+table_pattern = r'''
+	^(\|.*\|) \s*? \n								# starting and ending with |
+	^( (?:\| [ \|\-:]+ \| \s*? \n)? )				# column align
+	( (?:^\|.*\| \s*? \n)+ )							# multi-lines: starting and ending with |
+'''
+
+line_pattern = r'(?<=\n)-{5,}(?=\n)' # \n----\n
 
 
 def is_url(text):
@@ -151,19 +221,33 @@ def match_url(text):
 	else:
 		return None
 
-	while url:
-		if url[-1] in url_trailing_punctuation \
-			or (url[-1] == ')' and url.count(')') > url.count('(')):
-				url = url[:-1]
-		elif url[-1] == ';':
-			m = re.search('&\w+;$', url)
+	return _strip_url_tail(url)
+
+
+def _strip_url_tail(url):
+	# Strip trailing punctuation, unbalanced ")" and entity references,
+	# keep count of brackets instead of counting on each iteration
+	if url and url[-1] not in _url_tail_chars:
+		return url # common case, nothing to strip
+
+	end = len(url)
+	opening = url.count('(')
+	closing = url.count(')')
+	while end:
+		c = url[end-1]
+		if c in _url_trailing_punctuation:
+			end -= 1
+		elif c == ')' and closing > opening:
+			end -= 1
+			closing -= 1
+		elif c == ';':
+			m = url_entity_ref_re.search(url, 0, end)
 			if m:
-				ref = m.group(0)
-				url = url[:-len(ref)]
+				end = m.start()
 			else:
-				url = url[:-1]
+				end -= 1
 		else:
-			return url
+			return url[:end]
 	else:
 		return None
 
@@ -199,27 +283,24 @@ class WikiParser(object):
 		# Rules for inline formatting, links and tags
 		my_url_re = old_url_re if self.backward_url_parsing else url_re
 
-		descent = lambda *a: self.nested_inline_parser_below_link(*a)
-		self.nested_inline_parser_below_link = (
-			Rule(TAG, r'(?<!\S)@\w+', process=self.parse_tag)
-			| Rule(EMPHASIS, r'\*(?!\*)(.*?)(?<!:)\*', descent=descent) # no ':' at the end (ex: 'http://')
-			| Rule(STRONG, r'\*\*(?!\*)(.*?)\*\*', descent=descent)
-			| Rule(MARK, r'__(?!_)(.*?)__', descent=descent)
-			| Rule(SUBSCRIPT, r'_\{(?!~)(.+?)\}', descent=descent)
-			| Rule(SUPERSCRIPT, r'\^\{(?!~)(.+?)\}', descent=descent)
-			| Rule(STRIKE, r'~~(?!~)(.+?)~~', descent=descent)
-			| Rule(VERBATIM, r"`(?!`)(.+?)`")
-
+		self.nested_inline_parser_below_link = self._init_inline_format_rules(
+			lambda *a: self.nested_inline_parser_below_link(*a)
 		)
 
-		descent = lambda *a: self.inline_parser(*a)
 		return (
 			Rule(LINK, my_url_re, process=self.parse_url)
 			| Rule(IMAGE, r'\!\[(?!\[)(.*?)\]\((.*?)\)', process=self.parse_md_image)
 			| Rule(LINK, r'\[(?!\[)(.*?\]*)\]\((.*?)\)', process=self.parse_md_link)
 			| Rule(LINK, r'\[\[(?!\[)(.*?\]*)\]\]', process=self.parse_link)
 			| Rule(IMAGE, r'\{\{(?!\{)(.*?)\}\}', process=self.parse_image)
-			| Rule(TAG, r'(?<!\S)@\w+', process=self.parse_tag)
+			| self._init_inline_format_rules(lambda *a: self.inline_parser(*a))
+		)
+
+	def _init_inline_format_rules(self, descent):
+		# Rules for tags and inline formatting, used both for normal text
+		# and below links, where "descent" excludes nested links
+		return (
+			Rule(TAG, r'(?<!\S)@\w+', process=self.parse_tag)
 			| Rule(EMPHASIS, r'\*(?!\*)(.*?)(?<!:)\*', descent=descent) # no ':' at the end (ex: 'http://')
 			| Rule(STRONG, r'\*\*(?!\*)(.*?)\*\*', descent=descent)
 			| Rule(MARK, r'__(?!_)(.*?)__', descent=descent)
@@ -234,36 +315,9 @@ class WikiParser(object):
 		# TODO: deprecate this by taking lists out of the para
 		#       and make a new para for each indented block
 		p = RuleParser(
-			Rule(
-				'X-Bullet-List',
-				r'''(
-					^ %s .* \n								# Line starting with bullet
-					(?:
-						^ \t* %s .* \n						# Line with same or more indent and bullet
-					)*										# .. repeat
-				)''' % (bullet_pattern, bullet_pattern),
-				process=self.parse_list
-			),
-			Rule(
-				'X-Indented-Bullet-List',
-				r'''(
-					^(?P<list_indent>\t+) %s .* \n			# Line with indent and bullet
-					(?:
-						^(?P=list_indent) \t* %s .* \n		# Line with same or more indent and bullet
-					)*										# .. repeat
-				)''' % (bullet_pattern, bullet_pattern),
-				process=self.parse_list
-			),
-			Rule(
-				'X-Indented-Block',
-				r'''(
-					^(?P<block_indent>\t+) .* \n			# Line with indent
-					(?:
-						^(?P=block_indent) (?!\t|%s) .* \n	# Line with _same_ indent, no bullet
-					)*										# .. repeat
-				)''' % bullet_pattern,
-				process=self.parse_indent
-			),
+			Rule('X-Bullet-List', bullet_list_pattern, process=self.parse_list),
+			Rule('X-Indented-Bullet-List', indented_bullet_list_pattern, process=self.parse_list),
+			Rule('X-Indented-Block', indented_block_pattern, process=self.parse_indent),
 		)
 		p.process_unmatched = self.inline_parser
 		return p
@@ -271,35 +325,11 @@ class WikiParser(object):
 	def _init_block_parser(self):
 		# Top level parser, to break up block level items
 		p = RuleParser(
-			Rule(VERBATIM_BLOCK, r'''
-				^(?P<pre_indent>\t*) \`\`\` \s*?				# 3 "`"
-				( (?:^.*\n)*? )									# multi-line text
-				^(?P=pre_indent) \`\`\` \s*? \n					# another 3 "`" with matching indent
-				''',
-				process=self.parse_pre
-			),
-			Rule(OBJECT, r'''
-				^(?P<obj_indent>\t*) \{\{\{ \s*? (\S+:.*\n)		# "{{{ object_type: attrib=..."
-				( (?:^.*\n)*? ) 								# multi-line body
-				^(?P=obj_indent) \}\}\} \s*? \n					# "}}}" with matching indent
-				''',
-				process=self.parse_object
-			),
-			Rule(HEADING,
-				r'^( \#+ [\ \t]+ \S.*? ) [\ \t]* \n',		# "### heading"
-				process=self.parse_heading
-			),
-			# standard table format
-			Rule(TABLE, r'''
-				^(\|.*\|) \s*? \n								# starting and ending with |
-				^( (?:\| [ \|\-:]+ \| \s*? \n)? )				# column align
-				( (?:^\|.*\| \s*? \n)+ )							# multi-lines: starting and ending with |
-				''',
-				process=self.parse_table
-			),
-			# line format
-			Rule(LINE, r'(?<=\n)-{5,}(?=\n)', process=self.parse_line) # \n----\n
-
+			Rule(VERBATIM_BLOCK, verbatim_block_pattern, process=self.parse_pre),
+			Rule(OBJECT, object_pattern, process=self.parse_object),
+			Rule(HEADING, heading_pattern, process=self.parse_heading),
+			Rule(TABLE, table_pattern, process=self.parse_table), # standard table format
+			Rule(LINE, line_pattern, process=self.parse_line) # \n----\n
 		)
 		p.process_unmatched = self.parse_para
 		return p
@@ -307,12 +337,9 @@ class WikiParser(object):
 	def parse_heading(self, builder, text):
 		'''Parse heading and determine it's level'''
 		assert text.startswith('#')
-		for i, c in enumerate(text):
-			if c != '#':
-				break
-
-		level = min(5, i)
-		text = text[i:].lstrip() + '\n'
+		stripped = text.lstrip('#')
+		level = min(5, len(text) - len(stripped))
+		text = stripped.lstrip() + '\n'
 
 		builder.start(HEADING, {'level': level})
 		self.inline_parser(builder, text)
@@ -390,11 +417,8 @@ class WikiParser(object):
 		return ','.join(values)
 
 	def parse_table(self, builder, headerline, alignstyle, body):
-		headerrow = split_escaped_string(headerline.strip().strip('|'), '|')
-		rows = [
-				split_escaped_string(line.strip().strip('|'), '|')
-					for line in body.split('\n')[:-1]
-		]
+		headerrow = _split_table_row(headerline)
+		rows = [_split_table_row(line) for line in body.split('\n')[:-1]]
 
 		n_cols = max(len(headerrow), max(len(bodyrow) for bodyrow in rows))
 
@@ -457,21 +481,31 @@ class WikiParser(object):
 		if text.isspace():
 			builder.text(text)
 		else:
-			for block in empty_lines_re.split(text):
-				if not block: # empty string due to split
-					pass
-				elif block.isspace():
-					builder.text(block)
-				elif self.backward_indented_blocks \
-				and not unindented_line_re.search(block):
-					# Before zim 0.29 all indented paragraphs were
-					# verbatim.
-					builder.append(VERBATIM_BLOCK, None, block)
-				else:
-					block = convert_space_to_tab(block)
-					builder.start(PARAGRAPH)
-					self.list_and_indent_parser(builder, block)
-					builder.end(PARAGRAPH)
+			# Walk the empty lines in a single pass, the text in between
+			# are the paragraphs
+			pos = 0
+			for match in empty_lines_re.finditer(text):
+				start = match.start()
+				if start > pos:
+					self._parse_para_block(builder, text[pos:start])
+				builder.text(match.group(0))
+				pos = match.end()
+			if pos < len(text):
+				self._parse_para_block(builder, text[pos:])
+
+	def _parse_para_block(self, builder, block):
+		if block.isspace():
+			builder.text(block)
+		elif self.backward_indented_blocks \
+		and not unindented_line_re.search(block):
+			# Before zim 0.29 all indented paragraphs were
+			# verbatim.
+			builder.append(VERBATIM_BLOCK, None, block)
+		else:
+			block = convert_space_to_tab(block)
+			builder.start(PARAGRAPH)
+			self.list_and_indent_parser(builder, block)
+			builder.end(PARAGRAPH)
 
 	def parse_list(self, builder, text, indent=None):
 		'''Parse lists into items and recurse to get inline formatting
@@ -487,17 +521,42 @@ class WikiParser(object):
 		self.parse_list_lines(builder, lines, 0, attrib)
 
 	def parse_list_lines(self, builder, lines, level, attrib=None):
-		listtype = None
-		first = True
-		while lines:
-			line = lines[0]
-			m = bullet_line_re.match(line)
+		# Iterative parser for the list lines, "stack" contains the list
+		# types of the nested lists that are open, "first" means a new
+		# list needs to be opened at the current level
+		bullet_match = bullet_line_re.match
+		number_match = number_bullet_re.match
+		bullets = self.BULLETS
+		inline_parser = self.inline_parser
+
+		items = []
+		for line in lines:
+			m = bullet_match(line)
 			assert m, 'Line does not match a list item: >>%s<<' % line
 			prefix, bullet, text = m.groups()
+				# Unpacking groups() is faster than three calls to
+				# m.group() and match indexing needs python >= 3.6
 			bullet = bullet.rstrip()
 
+			# See if followed by a "checkbox" syntax, and then use
+			# it as bullet, per Zim content model.
+			if bullet in ('*', '-') and text.startswith('[') and text[3].isspace():
+				for b in bullets:
+					if text.startswith(b):
+						bullet = b
+						text = text[len(b) + 1:]
+
+			m = number_match(bullet)
+			number = m.group(1) if m else None
+			items.append((len(prefix), bullet, text, number))
+
+		stack = []
+		first = True
+		i = 0
+		while i < len(items):
+			mylevel, bullet, text, number = items[i]
+
 			if first:
-				number = check_number_bullet(bullet)
 				if number:
 					listtype = NUMBEREDLIST
 					if not attrib:
@@ -506,44 +565,38 @@ class WikiParser(object):
 				else:
 					listtype = BULLETLIST
 				builder.start(listtype, attrib)
+				stack.append(listtype)
 				first = False
+			else:
+				listtype = stack[-1]
 
-			# See if followed by a "checkbox" syntax, and then use
-			# it as bullet, per Zim content model.
-			if bullet in ('*', '-') and text.startswith('[') and text[3].isspace():
-				for b in self.BULLETS:
-					if text.startswith(b):
-						bullet = b
-						text = text[len(b) + 1:]
-
-			mylevel = len(prefix)
 			if mylevel > level:
-				self.parse_list_lines(builder, lines, level + 1) # recurs
+				level += 1
+				attrib = None
+				first = True
 			elif mylevel < level:
-				builder.end(listtype)
-				return
+				builder.end(stack.pop())
+				level -= 1
+			elif (listtype == NUMBEREDLIST and bullet in bullets) \
+			or (listtype == BULLETLIST and number is not None):
+				# Switch list type, start a new list at the same level
+				builder.end(stack.pop())
+				attrib = None
+				first = True
 			else:
 				if listtype == NUMBEREDLIST:
-					if bullet in self.BULLETS:
-						builder.end(listtype)
-						return self.parse_list_lines(builder, lines, level) # recurs
-					else:
-						attrib = None
-				else: # BULLETLIST
-					if bullet in self.BULLETS:
-						attrib = {'bullet': self.BULLETS[bullet]}
-					elif number_bullet_re.match(bullet):
-						builder.end(listtype)
-						return self.parse_list_lines(builder, lines, level) # recurs
-					else:
-						attrib = {'bullet': BULLET}
+					attrib = None
+				elif bullet in bullets:
+					attrib = {'bullet': bullets[bullet]}
+				else:
+					attrib = {'bullet': BULLET}
 				builder.start(LISTITEM, attrib)
-				self.inline_parser(builder, text)
+				inline_parser(builder, text)
 				builder.end(LISTITEM)
+				i += 1
 
-				lines.pop(0)
-
-		builder.end(listtype)
+		while stack:
+			builder.end(stack.pop())
 
 	def parse_indent(self, builder, text, indent):
 		'''Parse indented blocks and turn them into 'div' elements'''
@@ -562,11 +615,7 @@ class WikiParser(object):
 			href, text = text.split('|', 1)
 			text = text.strip('|') # stuff like "[[foo||bar]]"
 
-		if text.endswith(']'):
-			delta = text.count(']') - text.count('[')
-			if delta > 0:
-				self.inline_parser.backup_parser_offset(delta)
-				text = text[:-delta]
+		text = self._strip_unbalanced_brackets(text)
 
 		if href is None:
 			builder.append(LINK, {'href': text}, text)
@@ -575,6 +624,16 @@ class WikiParser(object):
 			self.nested_inline_parser_below_link(builder, text)
 			builder.end(LINK)
 
+	def _strip_unbalanced_brackets(self, text):
+		# The link regex matches up to the last "]", give back any
+		# closing brackets without matching opening bracket
+		if text.endswith(']'):
+			delta = text.count(']') - text.count('[')
+			if delta > 0:
+				self.inline_parser.backup_parser_offset(delta)
+				return text[:-delta]
+		return text
+
 	def parse_md_link(self, builder, text, href):
 		logger.debug("parse_md_link: page: %r, text: %r, href: %r", self.page, text, href)
 		if not text or text.isspace():
@@ -600,11 +659,7 @@ class WikiParser(object):
 			href = str(linked_page)
 			logger.debug("parse_md_link: converted href: %r", href)
 
-		if text.endswith(']'):
-			delta = text.count(']') - text.count('[')
-			if delta > 0:
-				self.inline_parser.backup_parser_offset(delta)
-				text = text[:-delta]
+		text = self._strip_unbalanced_brackets(text)
 
 		href += anchor
 
@@ -678,6 +733,24 @@ class WikiParser(object):
 
 wikiparser = WikiParser() #: singleton instance
 
+_wikiparsers = {(False, False): wikiparser}
+
+
+def get_wikiparser(backward_indented_blocks=False, backward_url_parsing=False):
+	'''Get a cached L{WikiParser} instance for the given flavor, so
+	parsing older format versions does not construct a new parser for
+	every page.
+	@param backward_indented_blocks: see L{WikiParser}
+	@param backward_url_parsing: see L{WikiParser}
+	@returns: a L{WikiParser} object
+	'''
+	key = (backward_indented_blocks, backward_url_parsing)
+	try:
+		return _wikiparsers[key]
+	except KeyError:
+		_wikiparsers[key] = WikiParser(*key)
+		return _wikiparsers[key]
+
 
 # FIXME FIXME we are redefining Parser here !
 class Parser(ParserClass):
@@ -702,9 +775,9 @@ class Parser(ParserClass):
 		if version == 'zim 0.6':
 			mywikiparser = wikiparser
 		elif version in ('zim 0.4', 'zim 0.5'):
-			mywikiparser = WikiParser(backward_url_parsing=True)
+			mywikiparser = get_wikiparser(backward_url_parsing=True)
 		else:
-			mywikiparser = WikiParser(backward_indented_blocks=True, backward_url_parsing=True)
+			mywikiparser = get_wikiparser(backward_indented_blocks=True, backward_url_parsing=True)
 
 		mywikiparser.page = self.page
 		mywikiparser.layout = self.layout
@@ -745,7 +818,15 @@ class Dumper(TextDumper):
 		SUPERSCRIPT: ('^{', '}'),
 	}
 
+	def __init__(self, *arg, **kwarg):
+		TextDumper.__init__(self, *arg, **kwarg)
+		self._link_cache = {}
+		self._page_folder = None
+
 	def dump(self, tree, file_output=False):
+		# Page may have changed since last dump, reset cached links
+		self._link_cache = {}
+		self._page_folder = None
 		return TextDumper.dump(self, tree)
 
 	def dump_pre(self, tag, attrib, strings):
@@ -781,16 +862,12 @@ class Dumper(TextDumper):
 		type = link_type(href)
 		logger.debug("layout root: %s, link type: %s", self.layout.root.path, type)
 		if href and type == "page":
-			# Convert page reference from Zim's internal format
-			# of 'Page1:Page2' to a filesystem path relative to the
-			# current page, e.g. 'Page2.md' or '../Page1/Page2.md'.
-			linked_path = self.notebook.pages.resolve_link(self.page, HRef.new_from_wiki_link(href))
-			logger.debug("%r links to %r" % (self.page, linked_path))
-			my_file, _ = self.layout.map_page(self.page)
-			link_file, _ = self.layout.map_page(linked_path)
-			relpath = link_file.relpath(LocalFolder(my_file.dirname), allowupward=True)
-			logger.debug("%r links to %r, relpath: %r", my_file, link_file, relpath)
-			href = relpath
+			try:
+				href = self._link_cache[href]
+			except KeyError:
+				relpath = self._resolve_page_link(href)
+				self._link_cache[href] = relpath
+				href = relpath
 
 		href += anchor
 
@@ -800,7 +877,24 @@ class Dumper(TextDumper):
 			else:
 				return ('[[', href, ']]')
 		else:
-			return ('[',) + tuple(strings) + ('](', href, ')')
+			result = ['[']
+			result.extend(strings)
+			result.extend(('](', href, ')'))
+			return result
+
+	def _resolve_page_link(self, href):
+		# Convert page reference from Zim's internal format
+		# of 'Page1:Page2' to a filesystem path relative to the
+		# current page, e.g. 'Page2.md' or '../Page1/Page2.md'.
+		if self._page_folder is None:
+			my_file, _ = self.layout.map_page(self.page)
+			self._page_folder = LocalFolder(my_file.dirname)
+		linked_path = self.notebook.pages.resolve_link(self.page, HRef.new_from_wiki_link(href))
+		logger.debug("%r links to %r" % (self.page, linked_path))
+		link_file, _ = self.layout.map_page(linked_path)
+		relpath = link_file.relpath(self._page_folder, allowupward=True)
+		logger.debug("%r links to %r, relpath: %r", self._page_folder, link_file, relpath)
+		return relpath
 
 	def dump_img(self, tag, attrib, strings=None):
 		att_folder = self.page.attachments_folder._inner_fs_object
@@ -808,37 +902,36 @@ class Dumper(TextDumper):
 		logger.debug("dump_img: page: %r, att folder: %r, rel path: %r", self.page, att_folder, rel_att_path)
 		src = attrib['src'] or ''
 		alt = attrib.get('alt')
-		opts = []
-		items = sorted(attrib.items())
-		for k, v in items:
-			if k in ('src', 'alt') or k.startswith('_'):
-				continue
-			elif v: # skip None, "" and 0
-				data = url_encode(str(v), mode=URL_ENCODE_DATA)
-				opts.append('%s=%s' % (k, data))
+		opts = '&'.join(
+			'%s=%s' % (k, url_encode(str(v), mode=URL_ENCODE_DATA))
+				for k, v in sorted(attrib.items())
+					if v and k not in ('src', 'alt') and not k.startswith('_') # skip None, "" and 0
+		)
 		if not alt:
 			alt = src
 		if src.startswith("./"):
 			src = src.replace(".", rel_att_path, 1)
 		if opts:
-			src += '?%s' % '&'.join(opts)
+			src += '?' + opts
 
 		return ('![', alt, '](', src, ')')
 
 	def dump_object_fallback(self, tag, attrib, strings=None):
 		assert "type" in attrib, "Undefined type of object"
 
-		opts = []
-		for key, value in sorted(list(attrib.items())):
-			# TODO: sorted to make order predictable for testing - prefer use of OrderedDict
-			if key in ('type', 'indent') or value is None:
-				continue
-			# double quotes are escaped by doubling them
-			opts.append(' %s="%s"' % (key, str(value).replace('"', '""')))
-
-		if not strings:
-			strings = []
-		return ['{{{', attrib['type'], ':'] + opts + ['\n'] + strings + ['}}}\n']
+		result = ['{{{', attrib['type'], ':']
+		# TODO: sorted to make order predictable for testing - prefer use of OrderedDict
+		# double quotes are escaped by doubling them
+		result.extend(
+			' %s="%s"' % (key, str(value).replace('"', '""'))
+				for key, value in sorted(attrib.items())
+					if key not in ('type', 'indent') and value is not None
+		)
+		result.append('\n')
+		if strings:
+			result.extend(strings)
+		result.append('}}}\n')
+		return result
 
 		# TODO put content in attrib, use text for caption (with full recursion)
 		# See img
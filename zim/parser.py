@@ -64,6 +64,9 @@ def fix_line_end(text):
 	return text
 
 
+_space_re_cache = {}
+	# compiled patterns for convert_space_to_tab() per tabstop
+
 def convert_space_to_tab(text, tabstop=4):
 	'''Convert spaces to tabs
 	@param text: the input text
@@ -72,16 +75,19 @@ def convert_space_to_tab(text, tabstop=4):
 	'''
 	# Fix tabs
 	spaces = ' ' * tabstop
-	pattern = '(?m)^(\t*)((?:%s)+)' % spaces
-	text = re.sub(
-		pattern,
+	if spaces not in text:
+		return text # nothing to convert
+
+	try:
+		space_re = _space_re_cache[tabstop]
+	except KeyError:
+		space_re = re.compile('^(\t*)((?:%s)+)' % spaces, re.M)
+		_space_re_cache[tabstop] = space_re
+
+	return space_re.sub(
 		lambda m: m.group(1) + '\t' * (len(m.group(2)) // tabstop),
 		text
 	)
-	# Specify "(?m)" instead of re.M since "flags" keyword is not
-	# supported in python 2.6
-
-	return text
 
 
 class Builder(object):
@@ -346,6 +352,11 @@ class Rule(object):
 			builder.append(self.tag, None, text)
 
 
+_compiled_rules = {}
+	# Combined regexes by pattern, shared between parser objects with
+	# the same rules, e.g. multiple instances of a format parser
+
+
 class Parser(object):
 	'''Parser class that matches multiple rules at once. It will
 	compile the patterns of various rules into a single regex and
@@ -404,48 +415,71 @@ class Parser(object):
 
 		assert text, 'BUG: processing empty string'
 		if self._re is None:
-			# Generate the regex and cache it for re-use
-			self.rules = tuple(self.rules) # freeze list
-			pattern = r'|'.join([
-				r"(?P<rule%i>%s)" % (i, r.pattern)
-					for i, r in enumerate(self.rules)
-			])
-			#print('PATTERN:\n', pattern.replace(')|(', ')\t|\n('), '\n...')
-			self._re = re.compile(pattern, re.U | re.M | re.X)
+			self._compile()
+
+		search = self._re.search
+		dispatch = self._dispatch
+		process_unmatched = self.process_unmatched
 
 		iter = 0
 		end = len(text)
-		match = self._re.search(text, iter)
+		match = search(text, iter)
 		while match:
 			mstart, mend = match.span()
 			if mstart > iter:
 				try:
-					self.process_unmatched(builder, text[iter:mstart])
+					process_unmatched(builder, text[iter:mstart])
 				except Exception as error:
 					self._raise_exception(error, text, iter, mstart, builder)
 
-			name = match.lastgroup # named outer group
-			i = int(name[4:]) # name is e.g. "rule1"
-			groups = [g for g in match.groups() if g is not None]
-			if len(groups) > 1:
-				groups.pop(0) # get rid of named outer group if inner groups are defined
+			# Only the groups of the matching rule can be set, use
+			# inner groups if defined, else the named outer group
+			rule, first, last = dispatch[match.lastgroup]
+			if last > first:
+				groups = [g for g in match.groups()[first:last] if g is not None] \
+					or [match.group(first)]
+			else:
+				groups = [match.group(first)]
 
 			self._backup_iter = 0
 			try:
-				self.rules[i].process(builder, *groups)
+				rule.process(builder, *groups)
 			except Exception as error:
-				self._raise_exception(error, text, mstart, mend, builder, self.rules[i])
+				self._raise_exception(error, text, mstart, mend, builder, rule)
 
 			iter = mend - self._backup_iter
-			match = self._re.search(text, iter)
+			match = search(text, iter)
 		else:
 			# no more matches
 			if iter < end:
 				try:
-					self.process_unmatched(builder, text[iter:])
+					process_unmatched(builder, text[iter:])
 				except Exception as error:
 					self._raise_exception(error, text, iter, end, builder)
 
+	def _compile(self):
+		# Generate the regex and cache it for re-use
+		self.rules = tuple(self.rules) # freeze list
+		pattern = r'|'.join([
+			r"(?P<rule%i>%s)" % (i, r.pattern)
+				for i, r in enumerate(self.rules)
+		])
+		#print('PATTERN:\n', pattern.replace(')|(', ')\t|\n('), '\n...')
+		try:
+			self._re = _compiled_rules[pattern]
+		except KeyError:
+			self._re = re.compile(pattern, re.U | re.M | re.X)
+			_compiled_rules[pattern] = self._re
+
+		# Map the name of the outer group of each rule to the rule and
+		# the index range of its groups
+		offsets = [self._re.groupindex['rule%i' % i] for i in range(len(self.rules))]
+		offsets.append(self._re.groups + 1)
+		self._dispatch = dict(
+			('rule%i' % i, (rule, offsets[i], offsets[i+1] - 1))
+				for i, rule in enumerate(self.rules)
+		)
+
 	parse = __call__
 
 	def backup_parser_offset(self, i):
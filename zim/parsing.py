@@ -63,21 +63,21 @@ def unescape_quoted_string(string):
 		string = escape_re.sub(replace, string)
 	return string
 
-def _escape(match):
-	char = match.group(0)
-	if char == '\n':
-		return '\\n'
-	elif char == '\t':
-		return '\\t'
-	else:
-		return '\\' + char
-
+_escape_tables = {}
+	# translation tables for escape_string() per set of extra chars
 
 def escape_string(string, chars=''):
 	'''Escape special characters with a backslash
 	Escapes newline, tab, backslash itself and any characters in C{chars}
 	'''
-	return re.sub('[\n\t\\\\%s]' % chars, _escape, string)
+	try:
+		table = _escape_tables[chars]
+	except KeyError:
+		table = {ord('\n'): '\\n', ord('\t'): '\\t', ord('\\'): '\\\\'}
+		for char in chars:
+			table.setdefault(ord(char), '\\' + char)
+		_escape_tables[chars] = table
+	return string.translate(table)
 
 
 def _unescape(match):
@@ -90,12 +90,16 @@ def _unescape(match):
 		return char
 
 
+_unescape_re = re.compile('\\\\.')
+
 def unescape_string(string):
 	'''Unescape backslash escapes in string
 	Recognizes C{\\n} and C{\\t} for newline and tab respectively,
 	otherwise keeps the literal character
 	'''
-	return re.sub('\\\\.', _unescape, string)
+	if '\\' not in string:
+		return string
+	return _unescape_re.sub(_unescape, string)
 
 
 def split_escaped_string(string, char):
@@ -107,8 +111,8 @@ def split_escaped_string(string, char):
 			parts[-1] = parts[-1] + char + piece
 		else:
 			parts.append(piece)
-		m = re.search('\\\\+$', piece)
-		trailing_backslash = m and len(m.group(0)) % 2 # uneven number of backslashes
+		n = len(piece) - len(piece.rstrip('\\'))
+		trailing_backslash = n % 2 # uneven number of backslashes
 	return parts
 
 